@@ -8,33 +8,20 @@ Autor: Rodrigo Viana - https://rodrigoviana.dev.br
 Versão: 1.0 - 23.08.2025
 """
 
+import array
 import sys
 import os
 from typing import List
-from network_calculator import NetworkCalculator
 
 
-class NetworkCalculatorCLI:
-    """Interface de linha de comando para a calculadora de rede."""
-    
-    def __init__(self):
-        """Inicializa a interface CLI."""
-        self.calculator = NetworkCalculator()
-        self.running = True
-    
-    def display_banner(self):
-        """Exibe o banner inicial do programa."""
-        banner = """
+_BANNER = """
 ╔══════════════════════════════════════════════════════════════════════════════╗
 ║                          CALCULADORA DE REDE                                 ║
 ║                     Sistema Completo para Cálculos de Rede                   ║
 ╚══════════════════════════════════════════════════════════════════════════════╝
         """
-        print(banner)
-    
-    def display_menu(self):
-        """Exibe o menu principal."""
-        menu = """
+
+_MENU = """
 ┌─────────────────────────────────────────────────────────────────────────────┐
 │                              MENU PRINCIPAL                                │
 ├─────────────────────────────────────────────────────────────────────────────┤
@@ -50,7 +37,70 @@ class NetworkCalculatorCLI:
 │  0. Sair                                                                   │
 └─────────────────────────────────────────────────────────────────────────────┘
         """
-        print(menu)
+
+
+def _make_calc():
+    """Importa e instancia a calculadora somente quando for necessária."""
+    from network_calculator import NetworkCalculator
+    return NetworkCalculator()
+
+
+class NetworkCalculatorCLI:
+    """Interface de linha de comando para a calculadora de rede."""
+    
+    def __init__(self):
+        """Inicializa a interface CLI."""
+        self._calculator = None
+        self.running = True
+        self._actions = {
+            1: self.option_1_network_info,
+            2: self.option_2_cidr_to_netmask,
+            3: self.option_3_netmask_to_cidr,
+            4: self.option_4_subnet_network,
+            5: self.option_5_vlsm,
+            6: self.option_6_ip_in_network,
+            7: self.option_7_supernet,
+            8: self.option_8_validate_ip,
+            9: self.option_9_validate_network
+        }
+        
+        # Em modo não interativo (entrada via pipe) lê todos os comandos de uma vez
+        if sys.stdin.isatty():
+            self._batch = None
+        else:
+            self._batch = iter(sys.stdin.read().splitlines())
+    
+    @property
+    def calculator(self):
+        """Calculadora de rede, criada no primeiro comando executado."""
+        if self._calculator is None:
+            self._calculator = _make_calc()
+        return self._calculator
+    
+    def display_banner(self):
+        """Exibe o banner inicial do programa."""
+        print(_BANNER)
+    
+    def display_menu(self):
+        """Exibe o menu principal."""
+        print(_MENU)
+    
+    def _read_line(self, prompt: str) -> str:
+        """Lê uma linha do terminal ou do lote de comandos recebido via pipe.
+        
+        Args:
+            prompt (str): Mensagem exibida apenas no modo interativo
+            
+        Returns:
+            str: Linha lida
+        """
+        if self._batch is None:
+            return input(prompt)
+        
+        try:
+            return next(self._batch)
+        except StopIteration:
+            raise EOFError
     
     def get_user_input(self, prompt: str, input_type: str = "string") -> any:
         """Obtém entrada do usuário com validação.
@@ -64,18 +114,18 @@ class NetworkCalculatorCLI:
         """
         while True:
             try:
-                user_input = input(f"\n{prompt}: ").strip()
+                user_input = self._read_line(f"\n{prompt}: ").strip()
                 
                 if input_type == "int":
                     return int(user_input)
                 elif input_type == "list_int":
-                    return [int(x.strip()) for x in user_input.split(',')]
+                    return array.array('q', map(int, user_input.split(',')))
                 elif input_type == "list_str":
                     return [x.strip() for x in user_input.split(',')]
                 else:
                     return user_input
                     
-            except ValueError:
+            except (ValueError, OverflowError):
                 print("❌ Entrada inválida. Tente novamente...")
             except KeyboardInterrupt:
                 print("\n\n👋 Programa interrompido pelo usuário!")
@@ -134,14 +184,20 @@ class NetworkCalculatorCLI:
         try:
             subnets = self.calculator.subnet_network(network, num_subnets)
             
-            print(f"\n✅ Divisão da rede {network} em {num_subnets} sub-redes:")
-            print("\n" + "─"*100)
-            print(f"{'ID':<3} {'Rede':<18} {'CIDR':<6} {'Máscara':<15} {'Broadcast':<15} {'Hosts':<8}")
-            print("─"*100)
-            
-            for subnet in subnets:
-                print(f"{subnet['subnet_id']:<3} {subnet['rede']:<18} {subnet['cidr']:<6} "
-                      f"{subnet['mascara']:<15} {subnet['broadcast']:<15} {subnet['hosts_disponiveis']:<8}")
+            # Monta a tabela inteira e escreve de uma só vez
+            lines = [
+                f"\n✅ Divisão da rede {network} em {num_subnets} sub-redes:",
+                "\n" + "─"*100,
+                f"{'ID':<3} {'Rede':<18} {'CIDR':<6} {'Máscara':<15} {'Broadcast':<15} {'Hosts':<8}",
+                "─"*100
+            ]
+            lines.extend(
+                f"{subnet['subnet_id']:<3} {subnet['rede']:<18} {subnet['cidr']:<6} "
+                f"{subnet['mascara']:<15} {subnet['broadcast']:<15} {subnet['hosts_disponiveis']:<8}"
+                for subnet in subnets
+            )
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
             
         except Exception as e:
             print(f"❌ Erro: {e}")
@@ -160,16 +216,20 @@ class NetworkCalculatorCLI:
         try:
             vlsm_subnets = self.calculator.calculate_vlsm(network, host_requirements)
             
-            print(f"\n✅ VLSM para a rede {network}:")
-            print("\n" + "─"*110)
-            print(f"{'Ordem':<6} {'Solicitado':<10} {'Rede':<18} {'CIDR':<6} {'Disponível':<10} {'Range de Hosts':<25}")
-            print("─"*110)
-            
+            # Monta a tabela inteira e escreve de uma só vez
+            lines = [
+                f"\n✅ VLSM para a rede {network}:",
+                "\n" + "─"*110,
+                f"{'Ordem':<6} {'Solicitado':<10} {'Rede':<18} {'CIDR':<6} {'Disponível':<10} {'Range de Hosts':<25}",
+                "─"*110
+            ]
             for subnet in vlsm_subnets:
                 host_range = f"{subnet['primeiro_host']} - {subnet['ultimo_host']}"
-                print(f"{subnet['ordem_original']:<6} {subnet['hosts_solicitados']:<10} "
-                      f"{subnet['rede']:<18} {subnet['cidr']:<6} {subnet['hosts_disponiveis']:<10} "
-                      f"{host_range:<25}")
+                lines.append(f"{subnet['ordem_original']:<6} {subnet['hosts_solicitados']:<10} "
+                             f"{subnet['rede']:<18} {subnet['cidr']:<6} {subnet['hosts_disponiveis']:<10} "
+                             f"{host_range:<25}")
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
             
         except Exception as e:
             print(f"❌ Erro: {e}")
@@ -205,9 +265,9 @@ class NetworkCalculatorCLI:
         networks_input = self.get_user_input("Redes", "list_str")
         
         try:
-            supernet = self.calculator.supernet_networks(networks_input)
+            supernet = self.calculator.calculate_supernet(networks_input)
             
-            if supernet:
+            if supernet is not None:
                 print(f"\n✅ Super-rede calculada: {supernet}")
                 print("\nInformações da super-rede:")
                 print(self.calculator.get_network_summary(supernet))
@@ -235,9 +295,7 @@ class NetworkCalculatorCLI:
                 ip_class = self.calculator._get_ip_class(ip)
                 print(f"   Classe: {ip_class}")
                 
-                import ipaddress
-                ip_obj = ipaddress.IPv4Address(ip)
-                is_private = self.calculator._is_private(ip_obj)
+                is_private = self.calculator.is_private(ip)
                 print(f"   Tipo: {'Privado' if is_private else 'Público'}")
             else:
                 print(f"\n❌ O endereço IP {ip} é INVÁLIDO")
@@ -273,39 +331,31 @@ class NetworkCalculatorCLI:
                 self.display_menu()
                 choice = self.get_user_input("\nEscolha uma opção", "int")
                 
+                action = self._actions.get(choice)
+                
                 if choice == 0:
                     print("\n👋 Obrigado por usar a Calculadora de Rede!")
                     self.running = False
-                elif choice == 1:
-                    self.option_1_network_info()
-                elif choice == 2:
-                    self.option_2_cidr_to_netmask()
-                elif choice == 3:
-                    self.option_3_netmask_to_cidr()
-                elif choice == 4:
-                    self.option_4_subnet_network()
-                elif choice == 5:
-                    self.option_5_vlsm()
-                elif choice == 6:
-                    self.option_6_ip_in_network()
-                elif choice == 7:
-                    self.option_7_supernet()
-                elif choice == 8:
-                    self.option_8_validate_ip()
-                elif choice == 9:
-                    self.option_9_validate_network()
+                elif action:
+                    action()
                 else:
                     print("❌ Opção inválida. Escolha um número de 0 a 9.")
                 
                 if choice != 0:
-                    input("\n\nPressione Enter para continuar...")
+                    self._read_line("\n\nPressione Enter para continuar...")
                     
             except KeyboardInterrupt:
                 print("\n\n👋 Programa interrompido pelo usuário.")
                 break
+            except EOFError:
+                # Fim da entrada (ex: lote de comandos via pipe encerrado)
+                break
             except Exception as e:
                 print(f"❌ Erro inesperado: {e}")
-                input("\nPressione Enter para continuar...")
+                try:
+                    self._read_line("\nPressione Enter para continuar...")
+                except EOFError:
+                    break
 
 
 if __name__ == "__main__":
@@ -8,24 +8,185 @@ Autor: Rodrigo Viana - https://rodrigoviana.dev.br
 Versão: 1.0 - 23.08.2025
 """
 
+import functools
 import ipaddress
-import socket
-import struct
-from typing import List, Dict, Tuple, Optional
-import re
+from collections.abc import Mapping
+from typing import List, Dict, Sequence, Tuple, Optional, Union
+
+from network_calculator_core import (
+    CIDR_TO_NETMASK, CLASS_TABLE, NETMASK_TO_CIDR, PREFIX_MASKS,
+    flsm_sweep, format_ipv4, is_private_int, parse_ipv4, parse_network, vlsm_sweep
+)
+
+
+# Modelo do resumo exibido por get_network_summary
+_SUMMARY_TEMPLATE = """\
+╔══════════════════════════════════════════════════════════════╗
+║                    INFORMAÇÕES DA REDE                      ║
+╠══════════════════════════════════════════════════════════════╣
+║ Rede:              {rede:<30} ║
+║ CIDR:              {mascara_cidr:<30} ║
+║ Máscara:           {mascara_decimal:<30} ║
+║ Broadcast:         {broadcast:<30} ║
+║ Primeiro Host:     {primeiro_host:<30} ║
+║ Último Host:       {ultimo_host:<30} ║
+║ Total de Hosts:    {total_hosts:<30} ║
+║ Total Endereços:   {total_enderecos:<30} ║
+║ Classe:            {classe:<30} ║
+║ Tipo:              {tipo:<30} ║
+╚══════════════════════════════════════════════════════════════╝"""
+
+
+def _subnet_info(base: int, prefix: int) -> Dict[str, str]:
+    """Formata os campos de uma sub-rede a partir do endereço base inteiro.
+    
+    Args:
+        base (int): Endereço de rede como inteiro (já alinhado ao prefixo)
+        prefix (int): Tamanho do prefixo (0-32)
+        
+    Returns:
+        Dict[str, str]: Rede, CIDR, máscara, broadcast, hosts e total disponível
+    """
+    size = 1 << (32 - prefix)
+    broadcast = base + size - 1
+    return {
+        'rede': format_ipv4(base),
+        'cidr': f'/{prefix}',
+        'mascara': CIDR_TO_NETMASK[prefix],
+        'broadcast': format_ipv4(broadcast),
+        'primeiro_host': format_ipv4(base + 1),
+        'ultimo_host': format_ipv4(broadcast - 1),
+        'hosts_disponiveis': str(size - 2)
+    }
+
+
+class NetworkFacts(Mapping):
+    """Informações de uma rede, formatadas apenas quando consultadas.
+    
+    Guarda somente o endereço base e o prefixo; cada campo é calculado no
+    acesso, seja como atributo (facts.rede) ou como chave (facts['rede']).
+    O acesso por chave mantém a compatibilidade com o dicionário retornado
+    anteriormente por calculate_network_info.
+    """
+    
+    __slots__ = ('base', 'prefix')
+    
+    _FIELDS = ('rede', 'mascara_cidr', 'mascara_decimal', 'broadcast',
+               'primeiro_host', 'ultimo_host', 'total_hosts', 'total_enderecos',
+               'classe', 'tipo')
+    
+    def __init__(self, base: int, prefix: int):
+        """Inicializa as informações da rede.
+        
+        Args:
+            base (int): Endereço da rede como inteiro (bits de host são zerados)
+            prefix (int): Tamanho do prefixo (0-32)
+        
+        Raises:
+            ValueError: Se o primeiro ou o último host ficar fora do espaço IPv4
+        """
+        self.base = base & PREFIX_MASKS[prefix]
+        self.prefix = prefix
+        
+        # Valida já na criação para que a leitura dos campos nunca falhe
+        if self.base == 0xffffffff or self._broadcast_int == 0:
+            raise ValueError(f"Rede inválida: {format_ipv4(self.base)}/{prefix} não possui hosts")
+    
+    @property
+    def _broadcast_int(self) -> int:
+        return self.base | (~PREFIX_MASKS[self.prefix] & 0xffffffff)
+    
+    @property
+    def rede(self) -> str:
+        return format_ipv4(self.base)
+    
+    @property
+    def mascara_cidr(self) -> str:
+        return f'/{self.prefix}'
+    
+    @property
+    def mascara_decimal(self) -> str:
+        return CIDR_TO_NETMASK[self.prefix]
+    
+    @property
+    def broadcast(self) -> str:
+        return format_ipv4(self._broadcast_int)
+    
+    @property
+    def primeiro_host(self) -> str:
+        return format_ipv4(self.base + 1)
+    
+    @property
+    def ultimo_host(self) -> str:
+        return format_ipv4(self._broadcast_int - 1)
+    
+    @property
+    def total_hosts(self) -> str:
+        return str((1 << (32 - self.prefix)) - 2)
+    
+    @property
+    def total_enderecos(self) -> str:
+        return str(1 << (32 - self.prefix))
+    
+    @property
+    def classe(self) -> str:
+        return CLASS_TABLE[self.base >> 24]
+    
+    @property
+    def tipo(self) -> str:
+        return 'Privada' if is_private_int(self.base) else 'Pública'
+    
+    def __getitem__(self, key: str) -> str:
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __contains__(self, key) -> bool:
+        return key in self._FIELDS
+    
+    def __iter__(self):
+        return iter(self._FIELDS)
+    
+    def __len__(self) -> int:
+        return len(self._FIELDS)
+    
+    def __repr__(self) -> str:
+        return f"NetworkFacts('{self.rede}{self.mascara_cidr}')"
+
+
+def _network_facts(network: Union[str, ipaddress.IPv4Network]) -> NetworkFacts:
+    """Converte uma rede (texto CIDR ou IPv4Network) em NetworkFacts.
+    
+    Args:
+        network (Union[str, IPv4Network]): Rede no formato CIDR ou já convertida
+        
+    Returns:
+        NetworkFacts: Informações da rede
+    """
+    if isinstance(network, ipaddress.IPv4Network):
+        return NetworkFacts(int(network.network_address), network.prefixlen)
+    return NetworkFacts(*parse_network(network))
+
+
+@functools.lru_cache(maxsize=256)
+def _network_summary(network: Union[str, ipaddress.IPv4Network]) -> str:
+    """Gera o resumo formatado de uma rede.
+    
+    O resultado fica em cache no processo, já que a mesma rede costuma ser
+    consultada várias vezes seguidas na CLI.
+    
+    Args:
+        network (Union[str, IPv4Network]): Rede no formato CIDR ou já convertida
+        
+    Returns:
+        str: Resumo formatado
+    """
+    return _SUMMARY_TEMPLATE.format_map(_network_facts(network))
 
 
 class NetworkCalculator:
     """Classe principal para cálculos de rede."""
     
-    def __init__(self):
-        """Inicializa a calculadora de rede."""
-        self.private_ranges = [
-            ipaddress.IPv4Network('10.0.0.0/8'),
-            ipaddress.IPv4Network('172.16.0.0/12'),
-            ipaddress.IPv4Network('192.168.0.0/16')
-        ]
-    
     def validate_ip(self, ip: str) -> bool:
         """Valida se um endereço IP é válido.
         
@@ -36,9 +197,9 @@ class NetworkCalculator:
             bool: True se válido, False caso contrário
         """
         try:
-            ipaddress.IPv4Address(ip)
+            parse_ipv4(ip)
             return True
-        except ipaddress.AddressValueError:
+        except ValueError:
             return False
     
     def validate_network(self, network: str) -> bool:
@@ -51,9 +212,9 @@ class NetworkCalculator:
             bool: True se válida, False caso contrário
         """
         try:
-            ipaddress.IPv4Network(network, strict=False)
+            parse_network(network)
             return True
-        except (ipaddress.AddressValueError, ipaddress.NetmaskValueError):
+        except ValueError:
             return False
     
     def cidr_to_netmask(self, cidr: int) -> str:
@@ -68,8 +229,7 @@ class NetworkCalculator:
         if not 0 <= cidr <= 32:
             raise ValueError("CIDR deve estar entre 0 e 32")
         
-        mask = (0xffffffff >> (32 - cidr)) << (32 - cidr)
-        return socket.inet_ntoa(struct.pack('>I', mask))
+        return CIDR_TO_NETMASK[cidr]
     
     def netmask_to_cidr(self, netmask: str) -> int:
         """Converte máscara de sub-rede para notação CIDR.
@@ -81,39 +241,21 @@ class NetworkCalculator:
             int: Valor CIDR
         """
         try:
-            return ipaddress.IPv4Network(f'0.0.0.0/{netmask}').prefixlen
-        except ipaddress.NetmaskValueError:
+            return NETMASK_TO_CIDR[netmask]
+        except KeyError:
             raise ValueError("Máscara de sub-rede inválida")
     
-    def calculate_network_info(self, network: str) -> Dict[str, str]:
+    def calculate_network_info(self, network: Union[str, ipaddress.IPv4Network]) -> NetworkFacts:
         """Calcula informações completas de uma rede.
         
         Args:
-            network (str): Rede no formato CIDR
+            network (Union[str, IPv4Network]): Rede no formato CIDR ou objeto
+                IPv4Network já convertido (evita um novo parse)
             
         Returns:
-            Dict[str, str]: Dicionário com informações da rede
+            NetworkFacts: Informações da rede, acessíveis como dicionário
         """
-        try:
-            net = ipaddress.IPv4Network(network, strict=False)
-            
-            info = {
-                'rede': str(net.network_address),
-                'mascara_cidr': f'/{net.prefixlen}',
-                'mascara_decimal': str(net.netmask),
-                'broadcast': str(net.broadcast_address),
-                'primeiro_host': str(net.network_address + 1),
-                'ultimo_host': str(net.broadcast_address - 1),
-                'total_hosts': str(net.num_addresses - 2),
-                'total_enderecos': str(net.num_addresses),
-                'classe': self._get_ip_class(str(net.network_address)),
-                'tipo': 'Privada' if self._is_private(net.network_address) else 'Pública'
-            }
-            
-            return info
-            
-        except (ipaddress.AddressValueError, ipaddress.NetmaskValueError) as e:
-            raise ValueError(f"Rede inválida: {e}")
+        return _network_facts(network)
     
     def subnet_network(self, network: str, num_subnets: int) -> List[Dict[str, str]]:
         """Divide uma rede em sub-redes.
@@ -126,60 +268,56 @@ class NetworkCalculator:
             List[Dict[str, str]]: Lista com informações das sub-redes
         """
         try:
-            net = ipaddress.IPv4Network(network, strict=False)
-            
-            # Calcula quantos bits são necessários para o número de sub-redes
-            import math
-            bits_needed = math.ceil(math.log2(num_subnets))
-            new_prefix = net.prefixlen + bits_needed
-            
-            if new_prefix > 32:
-                raise ValueError("Não é possível criar tantas sub-redes")
-            
-            subnets = list(net.subnets(new_prefix=new_prefix))
-            
-            result = []
-            for i, subnet in enumerate(subnets[:num_subnets]):
-                subnet_info = {
-                    'subnet_id': i + 1,
-                    'rede': str(subnet.network_address),
-                    'cidr': f'/{subnet.prefixlen}',
-                    'mascara': str(subnet.netmask),
-                    'broadcast': str(subnet.broadcast_address),
-                    'primeiro_host': str(subnet.network_address + 1),
-                    'ultimo_host': str(subnet.broadcast_address - 1),
-                    'hosts_disponiveis': str(subnet.num_addresses - 2)
-                }
-                result.append(subnet_info)
-            
-            return result
-            
-        except (ipaddress.AddressValueError, ipaddress.NetmaskValueError) as e:
+            base, prefix = parse_network(network)
+        except ValueError as e:
             raise ValueError(f"Erro ao dividir rede: {e}")
+        
+        new_prefix, subnet_bases = flsm_sweep(base, prefix, num_subnets)
+        
+        result = []
+        for i, subnet_base in enumerate(subnet_bases):
+            subnet_info = {'subnet_id': i + 1}
+            subnet_info.update(_subnet_info(subnet_base, new_prefix))
+            result.append(subnet_info)
+        
+        return result
     
-    def supernet_networks(self, networks: List[str]) -> Optional[str]:
+    def calculate_supernet(self, networks: List[str]) -> Optional[ipaddress.IPv4Network]:
         """Calcula a super-rede de uma lista de redes.
         
         Args:
             networks (List[str]): Lista de redes no formato CIDR
             
         Returns:
-            Optional[str]: Super-rede ou None se não for possível
+            Optional[IPv4Network]: Super-rede ou None se não for possível
         """
         try:
             net_objects = [ipaddress.IPv4Network(net, strict=False) for net in networks]
-            supernet = ipaddress.collapse_addresses(net_objects)
+            supernet = iter(ipaddress.collapse_addresses(net_objects))
             
             # Se todas as redes podem ser resumidas em uma única super-rede
-            supernet_list = list(supernet)
-            if len(supernet_list) == 1:
-                return str(supernet_list[0])
+            # (basta olhar os dois primeiros resultados)
+            first = next(supernet, None)
+            if first is not None and next(supernet, None) is None:
+                return first
             else:
                 return None
                 
         except (ipaddress.AddressValueError, ipaddress.NetmaskValueError):
             return None
     
+    def supernet_networks(self, networks: List[str]) -> Optional[str]:
+        """Calcula a super-rede de uma lista de redes.
+        
+        Args:
+            networks (List[str]): Lista de redes no formato CIDR
+            
+        Returns:
+            Optional[str]: Super-rede ou None se não for possível
+        """
+        supernet = self.calculate_supernet(networks)
+        return str(supernet) if supernet is not None else None
+    
     def ip_in_network(self, ip: str, network: str) -> bool:
         """Verifica se um IP pertence a uma rede.
         
@@ -191,76 +329,40 @@ class NetworkCalculator:
             bool: True se o IP pertence à rede
         """
         try:
-            ip_obj = ipaddress.IPv4Address(ip)
-            net_obj = ipaddress.IPv4Network(network, strict=False)
-            return ip_obj in net_obj
-        except (ipaddress.AddressValueError, ipaddress.NetmaskValueError):
+            ip_int = parse_ipv4(ip)
+            base, prefix = parse_network(network)
+        except ValueError:
             return False
+        
+        mask = PREFIX_MASKS[prefix]
+        return (ip_int & mask) == (base & mask)
     
-    def calculate_vlsm(self, network: str, host_requirements: List[int]) -> List[Dict[str, str]]:
+    def calculate_vlsm(self, network: str, host_requirements: Sequence[int]) -> List[Dict[str, str]]:
         """Calcula VLSM (Variable Length Subnet Masking).
         
         Args:
             network (str): Rede original
-            host_requirements (List[int]): Lista com número de hosts necessários
+            host_requirements (Sequence[int]): Número de hosts necessários por sub-rede
             
         Returns:
             List[Dict[str, str]]: Lista com sub-redes VLSM
         """
         try:
-            net = ipaddress.IPv4Network(network, strict=False)
-            
-            # Ordena os requisitos em ordem decrescente
-            sorted_requirements = sorted(enumerate(host_requirements), 
-                                       key=lambda x: x[1], reverse=True)
-            
-            result = []
-            current_network = net
-            
-            for original_index, hosts_needed in sorted_requirements:
-                # Calcula o prefixo necessário
-                import math
-                bits_for_hosts = math.ceil(math.log2(hosts_needed + 2))  # +2 para rede e broadcast
-                new_prefix = 32 - bits_for_hosts
-                
-                if new_prefix < current_network.prefixlen:
-                    raise ValueError(f"Não há espaço suficiente para {hosts_needed} hosts")
-                
-                # Encontra a primeira sub-rede disponível
-                subnet = None
-                for possible_subnet in current_network.subnets(new_prefix=new_prefix):
-                    subnet = possible_subnet
-                    break
-                
-                if subnet is None:
-                    raise ValueError("Não foi possível alocar sub-rede")
-                
-                subnet_info = {
-                    'ordem_original': original_index + 1,
-                    'hosts_solicitados': hosts_needed,
-                    'rede': str(subnet.network_address),
-                    'cidr': f'/{subnet.prefixlen}',
-                    'mascara': str(subnet.netmask),
-                    'broadcast': str(subnet.broadcast_address),
-                    'primeiro_host': str(subnet.network_address + 1),
-                    'ultimo_host': str(subnet.broadcast_address - 1),
-                    'hosts_disponiveis': str(subnet.num_addresses - 2)
-                }
-                result.append(subnet_info)
-                
-                # Atualiza a rede atual para excluir a sub-rede alocada
-                remaining_networks = list(current_network.address_exclude(subnet))
-                if remaining_networks:
-                    current_network = remaining_networks[0]
-                else:
-                    break
-            
-            # Reordena o resultado pela ordem original
-            result.sort(key=lambda x: x['ordem_original'])
-            return result
-            
-        except (ipaddress.AddressValueError, ipaddress.NetmaskValueError) as e:
+            base, base_prefix = parse_network(network)
+        except ValueError as e:
             raise ValueError(f"Erro no cálculo VLSM: {e}")
+        
+        result = []
+        for index, (subnet_base, new_prefix) in enumerate(
+                vlsm_sweep(host_requirements, base, base_prefix)):
+            subnet_info = {
+                'ordem_original': index + 1,
+                'hosts_solicitados': host_requirements[index]
+            }
+            subnet_info.update(_subnet_info(subnet_base, new_prefix))
+            result.append(subnet_info)
+        
+        return result
     
     def _get_ip_class(self, ip: str) -> str:
         """Determina a classe de um endereço IP.
@@ -272,69 +374,44 @@ class NetworkCalculator:
             str: Classe do IP (A, B, C, D, E)
         """
         try:
-            ip_obj = ipaddress.IPv4Address(ip)
-            first_octet = int(str(ip_obj).split('.')[0])
-            
-            if 1 <= first_octet <= 126:
-                return 'A'
-            elif 128 <= first_octet <= 191:
-                return 'B'
-            elif 192 <= first_octet <= 223:
-                return 'C'
-            elif 224 <= first_octet <= 239:
-                return 'D (Multicast)'
-            elif 240 <= first_octet <= 255:
-                return 'E (Experimental)'
-            else:
-                return 'Indefinida'
-        except:
+            return CLASS_TABLE[parse_ipv4(ip) >> 24]
+        except ValueError:
             return 'Inválida'
     
     def _is_private(self, ip) -> bool:
         """Verifica se um IP é privado.
         
         Args:
-            ip: Objeto IPv4Address
+            ip: Objeto IPv4Address ou endereço como inteiro
             
         Returns:
             bool: True se for IP privado
         """
-        for private_range in self.private_ranges:
-            if ip in private_range:
-                return True
-        return False
+        return is_private_int(int(ip))
     
-    def get_network_summary(self, network: str) -> str:
+    def is_private(self, ip: str) -> bool:
+        """Verifica se um endereço IP (em texto) é privado.
+        
+        Args:
+            ip (str): Endereço IP
+            
+        Returns:
+            bool: True se for IP privado
+        """
+        return is_private_int(parse_ipv4(ip))
+    
+    def get_network_summary(self, network: Union[str, ipaddress.IPv4Network]) -> str:
         """Gera um resumo formatado das informações da rede.
         
         Args:
-            network (str): Rede no formato CIDR
+            network (Union[str, IPv4Network]): Rede no formato CIDR ou objeto
+                IPv4Network já convertido (evita um novo parse)
             
         Returns:
             str: Resumo formatado
         """
         try:
-            info = self.calculate_network_info(network)
-            
-            summary = f"""
-╔══════════════════════════════════════════════════════════════╗
-║                    INFORMAÇÕES DA REDE                      ║
-╠══════════════════════════════════════════════════════════════╣
-║ Rede:              {info['rede']:<30} ║
-║ CIDR:              {info['mascara_cidr']:<30} ║
-║ Máscara:           {info['mascara_decimal']:<30} ║
-║ Broadcast:         {info['broadcast']:<30} ║
-║ Primeiro Host:     {info['primeiro_host']:<30} ║
-║ Último Host:       {info['ultimo_host']:<30} ║
-║ Total de Hosts:    {info['total_hosts']:<30} ║
-║ Total Endereços:   {info['total_enderecos']:<30} ║
-║ Classe:            {info['classe']:<30} ║
-║ Tipo:              {info['tipo']:<30} ║
-╚══════════════════════════════════════════════════════════════╝
-            """
-            
-            return summary.strip()
-            
+            return _network_summary(network)
         except ValueError as e:
             return f"Erro: {e}"
 
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Núcleo da Calculadora de Rede
+Rotinas de aritmética inteira sobre endereços IPv4 usadas por network_calculator
+
+O módulo é totalmente anotado e não depende de nada além da biblioteca
+padrão, podendo ser compilado com mypyc (ver setup.py). Quando a extensão
+compilada existe, ela tem precedência sobre este arquivo no import.
+
+Autor: Rodrigo Viana - https://rodrigoviana.dev.br
+Versão: 1.0 - 23.08.2025
+"""
+
+import socket
+import struct
+from typing import Dict, List, Sequence, Tuple
+
+
+# Máscaras pré-calculadas para os 33 prefixos válidos (/0 a /32)
+PREFIX_MASKS: Tuple[int, ...] = tuple((0xffffffff << (32 - p)) & 0xffffffff for p in range(33))
+CIDR_TO_NETMASK: Tuple[str, ...] = tuple(socket.inet_ntoa(struct.pack('>I', m)) for m in PREFIX_MASKS)
+NETMASK_TO_CIDR: Dict[str, int] = {m: p for p, m in enumerate(CIDR_TO_NETMASK)}
+
+
+def _build_class_table() -> Tuple[str, ...]:
+    """Monta a tabela de classes indexada pelo primeiro octeto."""
+    table = ['Indefinida'] * 256
+    for first, last, ip_class in ((1, 126, 'A'), (128, 191, 'B'), (192, 223, 'C'),
+                                  (224, 239, 'D (Multicast)'), (240, 255, 'E (Experimental)')):
+        table[first:last + 1] = [ip_class] * (last - first + 1)
+    return tuple(table)
+
+
+CLASS_TABLE: Tuple[str, ...] = _build_class_table()
+
+# Faixas privadas (RFC 1918) como pares (endereço base, máscara)
+PRIVATE_RANGES: Tuple[Tuple[int, int], ...] = (
+    (0x0A000000, 0xFF000000),  # 10.0.0.0/8
+    (0xAC100000, 0xFFF00000),  # 172.16.0.0/12
+    (0xC0A80000, 0xFFFF0000)   # 192.168.0.0/16
+)
+
+
+def parse_ipv4(ip: object) -> int:
+    """Converte um endereço IPv4 em texto para inteiro de 32 bits.
+    
+    O parâmetro é anotado como object porque recebe entrada do usuário: com
+    mypyc, uma anotação str viraria TypeError na chamada, antes da validação.
+    
+    Args:
+        ip (str): Endereço IP em formato decimal pontuado
+    
+    Returns:
+        int: Endereço IP como inteiro
+    """
+    if not isinstance(ip, str):
+        raise ValueError(f"Endereço IP inválido: {ip!r}")
+    
+    try:
+        return struct.unpack('>I', socket.inet_pton(socket.AF_INET, ip))[0]
+    except (OSError, ValueError):
+        raise ValueError(f"Endereço IP inválido: {ip!r}")
+
+
+def format_ipv4(ip_int: int) -> str:
+    """Converte um inteiro de 32 bits para endereço IPv4 em texto.
+    
+    Args:
+        ip_int (int): Endereço IP como inteiro
+    
+    Returns:
+        str: Endereço IP em formato decimal pontuado
+    """
+    try:
+        return socket.inet_ntoa(struct.pack('>I', ip_int))
+    except struct.error:
+        raise ValueError(f"Endereço IP fora do intervalo: {ip_int}")
+
+
+def parse_network(network: object) -> Tuple[int, int]:
+    """Converte uma rede CIDR em texto para (endereço base, prefixo).
+    
+    O prefixo pode ser informado em bits (/24) ou como máscara decimal
+    (/255.255.255.0). Assim como em parse_ipv4, o parâmetro é anotado
+    como object para que entradas que não são texto virem ValueError.
+    
+    Args:
+        network (str): Rede no formato CIDR (ex: 192.168.1.0/24)
+    
+    Returns:
+        Tuple[int, int]: Endereço base como inteiro e tamanho do prefixo
+    """
+    if not isinstance(network, str):
+        raise ValueError(f"Rede inválida: {network!r}")
+    
+    base, sep, prefix = network.partition('/')
+    if not sep:
+        raise ValueError(f"Rede inválida: {network!r}")
+    
+    # Somente dígitos ASCII: str.isdigit também aceita '²' e '٢٤'
+    if prefix and all('0' <= c <= '9' for c in prefix):
+        prefix_len = int(prefix)
+        if prefix_len > 32:
+            raise ValueError(f"Rede inválida: {network!r}")
+    else:
+        try:
+            prefix_len = NETMASK_TO_CIDR[prefix]
+        except KeyError:
+            raise ValueError(f"Rede inválida: {network!r}")
+    
+    return parse_ipv4(base), prefix_len
+
+
+def is_private_int(ip_int: int) -> bool:
+    """Verifica se um endereço IP (como inteiro) pertence a uma faixa privada.
+    
+    Args:
+        ip_int (int): Endereço IP como inteiro
+    
+    Returns:
+        bool: True se for IP privado
+    """
+    for base, mask in PRIVATE_RANGES:
+        if ip_int & mask == base:
+            return True
+    return False
+
+
+def vlsm_sweep(host_requirements: Sequence[int], base: int, base_prefix: int) -> List[Tuple[int, int]]:
+    """Aloca as sub-redes VLSM percorrendo a rede com um ponteiro inteiro.
+    
+    Os requisitos são atendidos do maior para o menor; cada sub-rede começa
+    no próximo endereço alinhado ao seu tamanho.
+    
+    Args:
+        host_requirements (Sequence[int]): Número de hosts necessários por sub-rede
+        base (int): Endereço da rede original como inteiro
+        base_prefix (int): Prefixo da rede original (0-32)
+    
+    Returns:
+        List[Tuple[int, int]]: (endereço da sub-rede, prefixo) na ordem original
+    """
+    cursor = base & PREFIX_MASKS[base_prefix]
+    end = cursor + (1 << (32 - base_prefix))
+    
+    # Ordena os índices dos requisitos em ordem decrescente de hosts
+    order = sorted(range(len(host_requirements)),
+                   key=host_requirements.__getitem__, reverse=True)
+    
+    result = [(0, 0)] * len(order)
+    for original_index in order:
+        hosts_needed = host_requirements[original_index]
+        if hosts_needed < 0:
+            raise ValueError(f"Número de hosts inválido: {hosts_needed}")
+        
+        # Calcula o prefixo necessário (+2 para rede e broadcast)
+        bits_for_hosts = max(2, (hosts_needed + 1).bit_length())
+        new_prefix = 32 - bits_for_hosts
+        size = 1 << bits_for_hosts
+        
+        # Alinha o ponteiro de alocação ao tamanho da sub-rede
+        cursor = (cursor + size - 1) & ~(size - 1)
+        if new_prefix < base_prefix or cursor + size > end:
+            raise ValueError(f"Não há espaço suficiente para {hosts_needed} hosts")
+        
+        # Grava já na posição original, dispensando a reordenação no final
+        result[original_index] = (cursor, new_prefix)
+        cursor += size
+    
+    return result
+
+
+def flsm_sweep(base: int, prefix: int, num_subnets: int) -> Tuple[int, List[int]]:
+    """Calcula os endereços das sub-redes FLSM de tamanho fixo.
+    
+    Gera apenas as num_subnets sub-redes pedidas, sem enumerar todas as
+    sub-redes possíveis do novo prefixo.
+    
+    Args:
+        base (int): Endereço da rede original como inteiro
+        prefix (int): Prefixo da rede original (0-32)
+        num_subnets (int): Número de sub-redes desejadas
+    
+    Returns:
+        Tuple[int, List[int]]: Novo prefixo e endereços das sub-redes
+    """
+    if num_subnets < 1:
+        raise ValueError("O número de sub-redes deve ser maior que zero")
+    
+    # Calcula quantos bits são necessários para o número de sub-redes
+    new_prefix = prefix + (num_subnets - 1).bit_length()
+    if new_prefix > 32:
+        raise ValueError("Não é possível criar tantas sub-redes")
+    
+    base &= PREFIX_MASKS[prefix]
+    size = 1 << (32 - new_prefix)
+    return new_prefix, [base + i * size for i in range(num_subnets)]
@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Compilação opcional do núcleo da Calculadora de Rede com mypyc
+
+Gera uma extensão nativa a partir de network_calculator_core.py, que passa a
+ser importada no lugar do módulo em Python puro. Sem a compilação, tudo
+continua funcionando normalmente.
+
+Uso:
+    pip install mypy
+    python setup.py build_ext --inplace
+"""
+
+from setuptools import setup
+from mypyc.build import mypycify
+
+setup(
+    name='network-calculator-core',
+    py_modules=['network_calculator', 'cli_interface'],
+    ext_modules=mypycify(['network_calculator_core.py']),
+)
@@ -8,154 +8,250 @@ Autor: Rodrigo Viana - https://rodrigoviana.dev.br
 Versão: 1.0 - 23.08.2025
 """
 
+import functools
+import io
+import ipaddress
 import unittest
 import sys
 import os
+from concurrent.futures import ProcessPoolExecutor
 
-# Adiciona o diretório atual ao path para importar os módulos
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+# Adiciona o diretório atual ao path para importar os módulos (somente se faltar)
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+if _THIS_DIR not in sys.path:
+    sys.path.insert(0, _THIS_DIR)
 
 from network_calculator import NetworkCalculator
 
+# Calculadora compartilhada por todas as classes de teste
+_CALC = NetworkCalculator()
+
+# Casos de teste montados uma única vez, na importação do módulo, e
+# compartilhados entre as classes de teste
+
+# Endereços já convertidos, usados por test_is_private
+_PRIVATE_ADDRS = tuple(ipaddress.IPv4Address(ip) for ip in ("10.0.0.1", "172.16.0.1", "192.168.1.1"))
+_PUBLIC_ADDRS = tuple(ipaddress.IPv4Address(ip) for ip in ("8.8.8.8", "1.1.1.1", "208.67.222.222"))
+
+_VALID_IPS = (
+    "192.168.1.1",
+    "10.0.0.1",
+    "172.16.0.1",
+    "8.8.8.8",
+    "127.0.0.1"
+)
+
+_INVALID_IPS = (
+    "256.1.1.1",
+    "192.168.1",
+    "192.168.1.1.1",
+    "abc.def.ghi.jkl",
+    "192.168.-1.1",
+    "",
+    None
+)
+
+_VALID_NETWORKS = (
+    "192.168.1.0/24",
+    "10.0.0.0/8",
+    "172.16.0.0/12",
+    "192.168.1.0/30",
+    "0.0.0.0/0",
+    "10.0.0.0/255.0.0.0"
+)
+
+_INVALID_NETWORKS = (
+    "192.168.1.0/33",
+    "256.1.1.0/24",
+    "192.168.1.0/-1",
+    "192.168.1.0",
+    "abc.def.ghi.jkl/24",
+    "10.0.0.0/255.0.255.0",
+    "1.2.3.4/٢٤",
+    "10.0.0.0/²",
+    None
+)
+
+_CIDR_CASES = (
+    (24, "255.255.255.0"),
+    (16, "255.255.0.0"),
+    (8, "255.0.0.0"),
+    (30, "255.255.255.252"),
+    (0, "0.0.0.0"),
+    (32, "255.255.255.255")
+)
+
+_INVALID_CIDRS = (-1, 33, 100)
+
+_NETMASK_CASES = (
+    ("255.255.255.0", 24),
+    ("255.255.0.0", 16),
+    ("255.0.0.0", 8),
+    ("255.255.255.252", 30),
+    ("0.0.0.0", 0),
+    ("255.255.255.255", 32)
+)
+
+_IP_CLASS_CASES = (
+    ("10.0.0.1", "A"),
+    ("172.16.0.1", "B"),
+    ("192.168.1.1", "C"),
+    ("224.0.0.1", "D (Multicast)"),
+    ("240.0.0.1", "E (Experimental)")
+)
+
+# IPs que pertencem (ou não) à rede usada por test_ip_in_network
+_MEMBER_IPS = ("192.168.1.1", "192.168.1.100", "192.168.1.254")
+_NON_MEMBER_IPS = ("192.168.2.1", "10.0.0.1", "172.16.0.1")
+
+_VLSM_REQUIREMENTS = (50, 25, 10)
+
+# Informações esperadas para 192.168.1.0/24
+_INFO_192_168_1_0_24 = {
+    'rede': '192.168.1.0',
+    'mascara_cidr': '/24',
+    'mascara_decimal': '255.255.255.0',
+    'broadcast': '192.168.1.255',
+    'primeiro_host': '192.168.1.1',
+    'ultimo_host': '192.168.1.254',
+    'total_hosts': '254',
+    'total_enderecos': '256',
+    'classe': 'C',
+    'tipo': 'Privada'
+}
+
+
+class _LazyMsg:
+    """Mensagem de asserção formatada apenas quando o unittest a exibe (na falha)."""
+    
+    __slots__ = ('template', 'args')
+    
+    def __init__(self, template, *args):
+        self.template = template
+        self.args = args
+    
+    def __str__(self):
+        return self.template.format(*self.args)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_info(network):
+    """Informações da rede, calculadas uma única vez por execução."""
+    return _CALC.calculate_network_info(network)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_subnets(network, num_subnets):
+    """Sub-redes FLSM da rede, calculadas uma única vez por execução."""
+    return _CALC.subnet_network(network, num_subnets)
+
 
 class TestNetworkCalculator(unittest.TestCase):
     """Classe de testes para NetworkCalculator."""
     
-    def setUp(self):
-        """Configura o ambiente de teste."""
-        self.calc = NetworkCalculator()
+    # Métodos puros memorizados enquanto esta classe de testes executa
+    _CACHED_METHODS = ('validate_ip', 'validate_network', 'cidr_to_netmask',
+                       'netmask_to_cidr', '_get_ip_class')
+    
+    @classmethod
+    def setUpClass(cls):
+        """Configura o ambiente de teste com uma calculadora exclusiva da classe."""
+        # Instância própria: os caches não alcançam _CALC nem as demais classes
+        cls.calc = NetworkCalculator()
+        
+        # Substitui os métodos por versões com cache apenas nesta instância
+        for name in cls._CACHED_METHODS:
+            setattr(cls.calc, name, functools.lru_cache(maxsize=256)(getattr(cls.calc, name)))
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Limpa os caches da calculadora da classe."""
+        for name in cls._CACHED_METHODS:
+            getattr(cls.calc, name).cache_clear()
     
     def test_validate_ip_valid(self):
         """Testa validação de IPs válidos."""
-        valid_ips = [
-            "192.168.1.1",
-            "10.0.0.1",
-            "172.16.0.1",
-            "8.8.8.8",
-            "127.0.0.1"
-        ]
-        
-        for ip in valid_ips:
-            with self.subTest(ip=ip):
-                self.assertTrue(self.calc.validate_ip(ip), f"IP {ip} deveria ser válido")
+        # Um único assertEqual; o diff do dicionário aponta o IP que falhou
+        validate = self.calc.validate_ip
+        results = {ip: validate(ip) for ip in _VALID_IPS}
+        self.assertEqual(results, dict.fromkeys(_VALID_IPS, True), "IPs deveriam ser válidos")
     
     def test_validate_ip_invalid(self):
         """Testa validação de IPs inválidos."""
-        invalid_ips = [
-            "256.1.1.1",
-            "192.168.1",
-            "192.168.1.1.1",
-            "abc.def.ghi.jkl",
-            "192.168.-1.1",
-            ""
-        ]
-        
-        for ip in invalid_ips:
-            with self.subTest(ip=ip):
-                self.assertFalse(self.calc.validate_ip(ip), f"IP {ip} deveria ser inválido")
+        validate = self.calc.validate_ip
+        results = {ip: validate(ip) for ip in _INVALID_IPS}
+        self.assertEqual(results, dict.fromkeys(_INVALID_IPS, False), "IPs deveriam ser inválidos")
     
     def test_validate_network_valid(self):
         """Testa validação de redes válidas."""
-        valid_networks = [
-            "192.168.1.0/24",
-            "10.0.0.0/8",
-            "172.16.0.0/12",
-            "192.168.1.0/30",
-            "0.0.0.0/0"
-        ]
-        
-        for network in valid_networks:
-            with self.subTest(network=network):
-                self.assertTrue(self.calc.validate_network(network), 
-                              f"Rede {network} deveria ser válida")
+        validate = self.calc.validate_network
+        results = {network: validate(network) for network in _VALID_NETWORKS}
+        self.assertEqual(results, dict.fromkeys(_VALID_NETWORKS, True), "Redes deveriam ser válidas")
     
     def test_validate_network_invalid(self):
         """Testa validação de redes inválidas."""
-        invalid_networks = [
-            "192.168.1.0/33",
-            "256.1.1.0/24",
-            "192.168.1.0/-1",
-            "192.168.1.0",
-            "abc.def.ghi.jkl/24"
-        ]
-        
-        for network in invalid_networks:
-            with self.subTest(network=network):
-                self.assertFalse(self.calc.validate_network(network), 
-                               f"Rede {network} deveria ser inválida")
+        validate = self.calc.validate_network
+        results = {network: validate(network) for network in _INVALID_NETWORKS}
+        self.assertEqual(results, dict.fromkeys(_INVALID_NETWORKS, False), "Redes deveriam ser inválidas")
     
     def test_cidr_to_netmask(self):
         """Testa conversão de CIDR para máscara."""
-        test_cases = [
-            (24, "255.255.255.0"),
-            (16, "255.255.0.0"),
-            (8, "255.0.0.0"),
-            (30, "255.255.255.252"),
-            (0, "0.0.0.0"),
-            (32, "255.255.255.255")
-        ]
-        
-        for cidr, expected_mask in test_cases:
-            with self.subTest(cidr=cidr):
-                result = self.calc.cidr_to_netmask(cidr)
-                self.assertEqual(result, expected_mask, 
-                               f"CIDR /{cidr} deveria resultar em {expected_mask}")
+        to_netmask = self.calc.cidr_to_netmask
+        results = {cidr: to_netmask(cidr) for cidr, _ in _CIDR_CASES}
+        self.assertEqual(results, dict(_CIDR_CASES), "Máscaras incorretas para os CIDRs")
     
     def test_cidr_to_netmask_invalid(self):
         """Testa conversão de CIDR inválido."""
-        invalid_cidrs = [-1, 33, 100]
-        
-        for cidr in invalid_cidrs:
+        to_netmask = self.calc.cidr_to_netmask
+        assert_raises = self.assertRaises
+        for cidr in _INVALID_CIDRS:
             with self.subTest(cidr=cidr):
-                with self.assertRaises(ValueError):
-                    self.calc.cidr_to_netmask(cidr)
+                with assert_raises(ValueError):
+                    to_netmask(cidr)
     
     def test_netmask_to_cidr(self):
         """Testa conversão de máscara para CIDR."""
-        test_cases = [
-            ("255.255.255.0", 24),
-            ("255.255.0.0", 16),
-            ("255.0.0.0", 8),
-            ("255.255.255.252", 30),
-            ("0.0.0.0", 0),
-            ("255.255.255.255", 32)
-        ]
-        
-        for mask, expected_cidr in test_cases:
-            with self.subTest(mask=mask):
-                result = self.calc.netmask_to_cidr(mask)
-                self.assertEqual(result, expected_cidr, 
-                               f"Máscara {mask} deveria resultar em /{expected_cidr}")
+        to_cidr = self.calc.netmask_to_cidr
+        results = {mask: to_cidr(mask) for mask, _ in _NETMASK_CASES}
+        self.assertEqual(results, dict(_NETMASK_CASES), "CIDRs incorretos para as máscaras")
     
     def test_calculate_network_info(self):
         """Testa cálculo de informações da rede."""
         network = "192.168.1.0/24"
-        info = self.calc.calculate_network_info(network)
+        info = _cached_info(network)
+        
+        # Compara todos os campos de uma vez; o diff do unittest aponta a chave divergente
+        actual = {key: info[key] for key in _INFO_192_168_1_0_24}
+        self.assertEqual(actual, _INFO_192_168_1_0_24, "Campos da rede calculados incorretamente")
+    
+    def test_network_facts_mapping(self):
+        """Testa o acesso às informações da rede como atributos e como dicionário."""
+        info = self.calc.calculate_network_info("192.168.1.0/24")
+        
+        self.assertEqual(info.rede, '192.168.1.0')
+        self.assertEqual(info.broadcast, '192.168.1.255')
+        self.assertEqual(dict(info), _INFO_192_168_1_0_24)
+        self.assertEqual(len(info), len(_INFO_192_168_1_0_24))
+        self.assertEqual(list(info), list(_INFO_192_168_1_0_24))
+        self.assertEqual(repr(info), "NetworkFacts('192.168.1.0/24')")
         
-        expected_info = {
-            'rede': '192.168.1.0',
-            'mascara_cidr': '/24',
-            'mascara_decimal': '255.255.255.0',
-            'broadcast': '192.168.1.255',
-            'primeiro_host': '192.168.1.1',
-            'ultimo_host': '192.168.1.254',
-            'total_hosts': '254',
-            'total_enderecos': '256',
-            'classe': 'C',
-            'tipo': 'Privada'
-        }
+        self.assertIn('primeiro_host', info)
+        self.assertNotIn('inexistente', info)
+        with self.assertRaises(KeyError):
+            info['inexistente']
         
-        for key, expected_value in expected_info.items():
-            with self.subTest(key=key):
-                self.assertEqual(info[key], expected_value, 
-                               f"Campo {key} deveria ser {expected_value}")
+        # Redes sem primeiro/último host representável falham na criação
+        for network in ("255.255.255.255/32", "0.0.0.0/32"):
+            with self.subTest(network=network):
+                with self.assertRaises(ValueError):
+                    self.calc.calculate_network_info(network)
     
     def test_subnet_network(self):
         """Testa divisão de rede em sub-redes."""
         network = "192.168.1.0/24"
         num_subnets = 4
         
-        subnets = self.calc.subnet_network(network, num_subnets)
+        subnets = _cached_subnets(network, num_subnets)
         
         # Verifica se retornou o número correto de sub-redes
         self.assertEqual(len(subnets), num_subnets)
@@ -169,25 +265,27 @@ class TestNetworkCalculator(unittest.TestCase):
     def test_ip_in_network(self):
         """Testa verificação se IP pertence à rede."""
         network = "192.168.1.0/24"
+        in_network = self.calc.ip_in_network
+        sub_test = self.subTest
         
         # IPs que pertencem à rede
-        valid_ips = ["192.168.1.1", "192.168.1.100", "192.168.1.254"]
-        for ip in valid_ips:
-            with self.subTest(ip=ip):
-                self.assertTrue(self.calc.ip_in_network(ip, network), 
-                              f"IP {ip} deveria pertencer à rede {network}")
+        assert_true = self.assertTrue
+        for ip in _MEMBER_IPS:
+            with sub_test(ip=ip):
+                assert_true(in_network(ip, network), 
+                            _LazyMsg("IP {} deveria pertencer à rede {}", ip, network))
         
         # IPs que não pertencem à rede
-        invalid_ips = ["192.168.2.1", "10.0.0.1", "172.16.0.1"]
-        for ip in invalid_ips:
-            with self.subTest(ip=ip):
-                self.assertFalse(self.calc.ip_in_network(ip, network), 
-                                f"IP {ip} não deveria pertencer à rede {network}")
+        assert_false = self.assertFalse
+        for ip in _NON_MEMBER_IPS:
+            with sub_test(ip=ip):
+                assert_false(in_network(ip, network), 
+                             _LazyMsg("IP {} não deveria pertencer à rede {}", ip, network))
     
     def test_calculate_vlsm(self):
         """Testa cálculo de VLSM."""
         network = "192.168.1.0/24"
-        host_requirements = [50, 25, 10]
+        host_requirements = _VLSM_REQUIREMENTS
         
         vlsm_subnets = self.calc.calculate_vlsm(network, host_requirements)
         
@@ -199,49 +297,71 @@ class TestNetworkCalculator(unittest.TestCase):
             self.assertEqual(subnet['ordem_original'], i + 1)
             self.assertEqual(subnet['hosts_solicitados'], host_requirements[i])
     
+    def test_calculate_vlsm_allocation(self):
+        """Testa se o VLSM aloca sub-redes contíguas e detecta falta de espaço."""
+        vlsm_subnets = self.calc.calculate_vlsm("192.168.1.0/24", [50, 25, 10, 5])
+        
+        networks = [f"{subnet['rede']}{subnet['cidr']}" for subnet in vlsm_subnets]
+        self.assertEqual(networks, ["192.168.1.0/26", "192.168.1.64/27",
+                                    "192.168.1.96/28", "192.168.1.112/29"])
+        
+        with self.assertRaises(ValueError):
+            self.calc.calculate_vlsm("192.168.1.0/24", [100, 100, 50])
+        
+        with self.assertRaises(ValueError):
+            self.calc.calculate_vlsm("192.168.1.0/24", [50, 25, 10, -5])
+    
+    def test_calculate_supernet(self):
+        """Testa cálculo de super-rede."""
+        supernet = self.calc.calculate_supernet(["192.168.1.0/25", "192.168.1.128/25"])
+        self.assertEqual(supernet, ipaddress.ip_network("192.168.1.0/24"))
+        
+        # Redes disjuntas não formam uma única super-rede
+        self.assertIsNone(self.calc.calculate_supernet(["192.168.1.0/24", "10.0.0.0/24"]))
+        
+        # Entrada inválida
+        self.assertIsNone(self.calc.calculate_supernet(["abc.def.ghi.jkl/24"]))
+    
+    def test_supernet_networks(self):
+        """Testa cálculo de super-rede em formato texto."""
+        self.assertEqual(self.calc.supernet_networks(["10.0.0.0/9", "10.128.0.0/9"]), "10.0.0.0/8")
+        self.assertIsNone(self.calc.supernet_networks(["192.168.1.0/24", "10.0.0.0/24"]))
+        self.assertIsNone(self.calc.supernet_networks(["192.168.1.0/33"]))
+    
     def test_get_ip_class(self):
         """Testa determinação da classe do IP."""
-        test_cases = [
-            ("10.0.0.1", "A"),
-            ("172.16.0.1", "B"),
-            ("192.168.1.1", "C"),
-            ("224.0.0.1", "D (Multicast)"),
-            ("240.0.0.1", "E (Experimental)")
-        ]
-        
-        for ip, expected_class in test_cases:
-            with self.subTest(ip=ip):
-                result = self.calc._get_ip_class(ip)
-                self.assertEqual(result, expected_class, 
-                               f"IP {ip} deveria ser classe {expected_class}")
+        get_class = self.calc._get_ip_class
+        results = {ip: get_class(ip) for ip, _ in _IP_CLASS_CASES}
+        self.assertEqual(results, dict(_IP_CLASS_CASES), "Classes incorretas para os IPs")
     
     def test_is_private(self):
         """Testa verificação de IP privado."""
-        import ipaddress
+        is_private = self.calc._is_private
+        sub_test = self.subTest
         
         # IPs privados
-        private_ips = ["10.0.0.1", "172.16.0.1", "192.168.1.1"]
-        for ip in private_ips:
-            with self.subTest(ip=ip):
-                ip_obj = ipaddress.IPv4Address(ip)
-                self.assertTrue(self.calc._is_private(ip_obj), 
-                              f"IP {ip} deveria ser privado")
+        assert_true = self.assertTrue
+        for ip_obj in _PRIVATE_ADDRS:
+            with sub_test(ip=str(ip_obj)):
+                assert_true(is_private(ip_obj), _LazyMsg("IP {} deveria ser privado", ip_obj))
         
         # IPs públicos
-        public_ips = ["8.8.8.8", "1.1.1.1", "208.67.222.222"]
-        for ip in public_ips:
-            with self.subTest(ip=ip):
-                ip_obj = ipaddress.IPv4Address(ip)
-                self.assertFalse(self.calc._is_private(ip_obj), 
-                                f"IP {ip} deveria ser público")
+        assert_false = self.assertFalse
+        for ip_obj in _PUBLIC_ADDRS:
+            with sub_test(ip=str(ip_obj)):
+                assert_false(is_private(ip_obj), _LazyMsg("IP {} deveria ser público", ip_obj))
 
 
 class TestIntegration(unittest.TestCase):
     """Testes de integração."""
     
-    def setUp(self):
-        """Configura o ambiente de teste."""
-        self.calc = NetworkCalculator()
+    @classmethod
+    def setUpClass(cls):
+        """Configura o ambiente de teste (a calculadora não guarda estado)."""
+        cls.calc = _CALC
+        
+        # Rede do fluxo convertida uma única vez para toda a classe
+        cls._NET_10_0_0_0_8 = ipaddress.ip_network("10.0.0.0/8")
     
     def test_complete_workflow(self):
         """Testa um fluxo completo de uso."""
@@ -249,72 +369,166 @@ class TestIntegration(unittest.TestCase):
         network = "10.0.0.0/8"
         self.assertTrue(self.calc.validate_network(network))
         
-        # 2. Calcular informações da rede
-        info = self.calc.calculate_network_info(network)
+        # 2. Calcular informações da rede (a calculadora aceita a rede já convertida)
+        info = _cached_info(self._NET_10_0_0_0_8)
         self.assertEqual(info['classe'], 'A')
         self.assertEqual(info['tipo'], 'Privada')
         
         # 3. Dividir em sub-redes
-        subnets = self.calc.subnet_network(network, 4)
+        subnets = _cached_subnets(network, 4)
         self.assertEqual(len(subnets), 4)
         
         # 4. Verificar se um IP pertence à rede original
         test_ip = "10.1.1.1"
         self.assertTrue(self.calc.ip_in_network(test_ip, network))
         
-        # 5. Verificar se o IP pertence a uma das sub-redes
-        belongs_to_subnet = any(
-            self.calc.ip_in_network(test_ip, f"{subnet['rede']}{subnet['cidr']}")
-            for subnet in subnets
-        )
-        self.assertTrue(belongs_to_subnet)
+        # 5. Verificar se o IP pertence a uma das sub-redes (cada endereço é convertido uma vez)
+        addr = ipaddress.IPv4Address(test_ip)
+        nets = [ipaddress.ip_network(f"{subnet['rede']}{subnet['cidr']}") for subnet in subnets]
+        self.assertTrue(any(addr in net for net in nets))
+
+
+class _SummaryResult(unittest.TextTestResult):
+    """Resultado que guarda a mensagem de cada falha e erro para o resumo.
+    
+    A mensagem vem direto da exceção capturada, sem reprocessar o traceback
+    já formatado pelo unittest. Só a primeira linha é guardada; o diff
+    completo já aparece no relatório do runner.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failure_messages = []
+        self.error_messages = []
+    
+    @staticmethod
+    def _first_line(exc_value):
+        """Primeira linha da mensagem da exceção."""
+        return str(exc_value).partition('\n')[0]
+    
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self.failure_messages.append((str(test), self._first_line(err[1])))
+    
+    def addError(self, test, err):
+        super().addError(test, err)
+        self.error_messages.append((str(test), f"{err[0].__name__}: {self._first_line(err[1])}"))
+    
+    def addSubTest(self, test, subtest, err):
+        super().addSubTest(test, subtest, err)
+        if err is None:
+            return
+        if issubclass(err[0], test.failureException):
+            self.failure_messages.append((str(subtest), self._first_line(err[1])))
+        else:
+            self.error_messages.append((str(subtest), f"{err[0].__name__}: {self._first_line(err[1])}"))
+
+
+def _run_test_by_name(name):
+    """Executa um único teste em um processo separado.
+    
+    Args:
+        name (str): Nome do teste (ex: TestIntegration.test_complete_workflow)
+        
+    Returns:
+        tuple: (testes executados, falhas, erros), com falhas e erros como
+            listas de (descrição do teste, mensagem)
+    """
+    test = unittest.defaultTestLoader.loadTestsFromName(name, sys.modules[__name__])
+    result = _SummaryResult(io.StringIO(), False, 0)
+    test.run(result)
+    return result.testsRun, result.failure_messages, result.error_messages
+
+
+def _iter_tests(suite):
+    """Percorre recursivamente os testes de uma suite."""
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
+
+
+def _run_parallel(suite):
+    """Distribui os testes entre os núcleos disponíveis e junta os resultados.
+    
+    Args:
+        suite (unittest.TestSuite): Suite com os testes a executar
+        
+    Returns:
+        _SummaryResult: Resultado combinado de todos os processos
+    """
+    # Nome relativo ao módulo (ex: TestIntegration.test_complete_workflow)
+    names = [test.id().partition('.')[2] for test in _iter_tests(suite)]
+    
+    result = _SummaryResult(io.StringIO(), False, 0)
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        for tests_run, failures, errors in executor.map(_run_test_by_name, names):
+            result.testsRun += tests_run
+            result.failures.extend(failures)
+            result.errors.extend(errors)
+            result.failure_messages.extend(failures)
+            result.error_messages.extend(errors)
+    
+    return result
 
 
 def run_tests():
     """Executa todos os testes."""
-    print("="*70)
-    print("           EXECUTANDO TESTES DA CALCULADORA DE REDE")
-    print("="*70)
+    sys.stdout.write("\n".join([
+        "="*70,
+        "           EXECUTANDO TESTES DA CALCULADORA DE REDE",
+        "="*70
+    ]) + "\n")
+    sys.stdout.flush()
     
-    # Cria a suite de testes
+    # Cria a suite com todos os testes do módulo
     loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Adiciona os testes
-    suite.addTests(loader.loadTestsFromTestCase(TestNetworkCalculator))
-    suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
-    
-    # Executa os testes
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Mostra o resumo
-    print("\n" + "="*70)
-    print("                        RESUMO DOS TESTES")
-    print("="*70)
-    print(f"Testes executados: {result.testsRun}")
-    print(f"Sucessos: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"Falhas: {len(result.failures)}")
-    print(f"Erros: {len(result.errors)}")
-    
-    if result.failures:
-        print("\n❌ FALHAS:")
-        for test, traceback in result.failures:
-            print(f"  - {test}: {traceback.split('AssertionError: ')[-1].split('\n')[0]}")
-    
-    if result.errors:
-        print("\n❌ ERROS:")
-        for test, traceback in result.errors:
-            print(f"  - {test}: {traceback.split('\n')[-2]}")
-    
-    if result.wasSuccessful():
-        print("\n✅ TODOS OS TESTES PASSARAM!")
+    suite = loader.loadTestsFromModule(sys.modules[__name__])
+    
+    # Executa os testes (PARALLEL_TESTS=1 distribui entre os núcleos da máquina)
+    if os.environ.get("PARALLEL_TESTS"):
+        result = _run_parallel(suite)
     else:
-        print("\n❌ ALGUNS TESTES FALHARAM!")
+        # QUIET_TESTS=1 suprime a linha por teste; a saída dos testes fica em buffer
+        verbosity = 0 if os.environ.get("QUIET_TESTS") else 2
+        runner = unittest.TextTestRunner(verbosity=verbosity, buffer=True,
+                                         resultclass=_SummaryResult)
+        result = runner.run(suite)
+    
+    num_failures = len(result.failures)
+    num_errors = len(result.errors)
+    success = result.wasSuccessful()
+    
+    # Monta o resumo inteiro e escreve de uma só vez
+    lines = [
+        "\n" + "="*70,
+        "                        RESUMO DOS TESTES",
+        "="*70,
+        f"Testes executados: {result.testsRun}",
+        f"Sucessos: {result.testsRun - num_failures - num_errors}",
+        f"Falhas: {num_failures}",
+        f"Erros: {num_errors}"
+    ]
+    
+    if success:
+        lines.append("\n✅ TODOS OS TESTES PASSARAM!")
+    else:
+        if num_failures:
+            lines.append("\n❌ FALHAS:")
+            lines.extend(f"  - {test}: {message}" for test, message in result.failure_messages)
+        
+        if num_errors:
+            lines.append("\n❌ ERROS:")
+            lines.extend(f"  - {test}: {message}" for test, message in result.error_messages)
+        
+        lines.append("\n❌ ALGUNS TESTES FALHARAM!")
     
-    print("="*70)
+    lines.append("="*70)
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     
-    return result.wasSuccessful()
+    return success
 
 
 if __name__ == "__main__":